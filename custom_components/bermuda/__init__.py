@@ -12,14 +12,15 @@ from typing import TYPE_CHECKING
 
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.device_registry import DeviceEntry, format_mac
 
 from .const import _LOGGER, DOMAIN, PLATFORMS, STARTUP_MESSAGE
 from .coordinator import BermudaDataUpdateCoordinator
+from .util import mac_norm
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.device_registry import DeviceEntry
 
 type BermudaConfigEntry = ConfigEntry[BermudaData]
 
@@ -67,19 +68,16 @@ async def async_remove_config_entry_device(
     """Remove a config entry from a device."""
     coordinator: BermudaDataUpdateCoordinator = config_entry.runtime_data.coordinator
     address = None
-    for ident in device_entry.identifiers:
-        try:
-            if ident[0] == DOMAIN:
-                # the identifier should be the base device address, and
-                # may have "_range" or some other per-sensor suffix.
-                # The address might be a mac address, IRK or iBeacon uuid
-                address = ident[1].split("_")[0]
-        except KeyError:
-            pass
+    for ident_domain, ident_id in device_entry.identifiers:
+        if ident_domain == DOMAIN:
+            # the identifier should be the base device address, and
+            # may have "_range" or some other per-sensor suffix.
+            # The address might be a mac address, IRK or iBeacon uuid
+            address = ident_id.split("_")[0]
     if address is not None:
-        try:
-            coordinator.devices[format_mac(address)].create_sensor = False
-        except KeyError:
+        if (device := coordinator.devices.get(mac_norm(address))) is not None:
+            device.create_sensor = False
+        else:
             _LOGGER.warning("Failed to locate device entry for %s", address)
         return True
     # Even if we don't know this address it probably just means it's stale or from
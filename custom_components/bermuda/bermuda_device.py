@@ -16,7 +16,6 @@ import re
 
 from homeassistant.components.bluetooth import MONOTONIC_TIME, BluetoothScannerDevice
 from homeassistant.const import STATE_HOME, STATE_NOT_HOME, STATE_UNAVAILABLE
-from homeassistant.helpers.device_registry import format_mac
 
 from .bermuda_device_scanner import BermudaDeviceScanner
 from .const import (
@@ -33,7 +32,9 @@ from .const import (
     CONF_DEVICES,
     CONF_DEVTRACK_TIMEOUT,
     DEFAULT_DEVTRACK_TIMEOUT,
+    DISTANCE_TIMEOUT,
 )
+from .util import mac_norm
 
 
 class BermudaDevice(dict):
@@ -48,6 +49,49 @@ class BermudaDevice(dict):
     become entities in homeassistant, since there might be a _lot_ of them.
     """
 
+    # There are a lot of these, so avoid a per-instance __dict__. Keep this in the
+    # same order as the assignments in __init__, since to_dict() uses it for the
+    # ordering of dump_devices output.
+    __slots__ = (  # noqa: RUF023
+        "name",
+        "local_name",
+        "prefname",
+        "address",
+        "ref_power",
+        "ref_power_changed",
+        "options",
+        "is_configured",
+        "unique_id",
+        "address_type",
+        "area_id",
+        "area_name",
+        "area_distance",
+        "area_rssi",
+        "area_scanner",
+        "zone",
+        "manufacturer",
+        "connectable",
+        "is_scanner",
+        "is_metadevice",
+        "beacon_type",
+        "beacon_sources",
+        "beacon_unique_id",
+        "beacon_uuid",
+        "beacon_major",
+        "beacon_minor",
+        "beacon_power",
+        "entry_id",
+        "create_sensor",
+        "create_sensor_done",
+        "create_tracker_done",
+        "create_number_done",
+        "create_button_done",
+        "create_all_done",
+        "last_seen",
+        "scanners",
+        "idle_last_seen",
+    )
+
     def __init__(self, address, options) -> None:
         """Initial (empty) data."""
         self.name: str | None = None
@@ -57,6 +101,8 @@ class BermudaDevice(dict):
         self.ref_power: float = 0  # If non-zero, use in place of global ref_power.
         self.ref_power_changed: float = 0  # Stamp for last change to ref_power, for cache zapping.
         self.options = options
+        # Options don't change without a reload (and new devices), so only check this once.
+        self.is_configured: bool = address.upper() in options.get(CONF_DEVICES, [])
         self.unique_id: str | None = None  # mac address formatted.
         self.address_type = BDADDR_TYPE_UNKNOWN
         self.area_id: str | None = None
@@ -68,6 +114,7 @@ class BermudaDevice(dict):
         self.manufacturer: str | None = None
         self.connectable: bool = False
         self.is_scanner: bool = False
+        self.is_metadevice: bool = False  # Registered in the coordinator's metadevices
         self.beacon_type: set = set()
         self.beacon_sources = []  # list of MAC addresses that have advertised this beacon
         self.beacon_unique_id: str | None = None  # combined uuid_major_minor for *really* unique id
@@ -85,6 +132,8 @@ class BermudaDevice(dict):
         self.create_all_done: bool = False  # All platform entities are done and ready.
         self.last_seen: float = 0  # stamp from most recent scanner spotting. MONOTONIC_TIME
         self.scanners: dict[str, BermudaDeviceScanner] = {}
+        # last_seen as at the calculate_data() that found us idle, see calculate_data()
+        self.idle_last_seen: float | None = None
 
         # BLE MAC addresses (https://www.bluetooth.com/specifications/core54-html/) can
         # be differentiated by the top two MSBs of the 48bit MAC address. At our end at
@@ -140,6 +189,7 @@ class BermudaDevice(dict):
         if new_ref_power != self.ref_power:
             # it's actually changed, proceed...
             self.ref_power = new_ref_power
+            self.idle_last_seen = None
             nearest_distance = 9999  # running tally to find closest scanner
             nearest_scanner = None
             for scanner in self.scanners.values():
@@ -190,19 +240,33 @@ class BermudaDevice(dict):
                 self.area_name,
             )
 
-    def calculate_data(self):
+    def calculate_data(self, nowstamp: float | None = None):
         """
         Call after doing update_scanner() calls so that distances
         etc can be freshly smoothed and filtered.
 
+        nowstamp is the coordinator's MONOTONIC_TIME() for this update cycle,
+        so the clock is read once per cycle rather than per device and scanner.
+
+        If every scanner has timed out and the device is not_home, running
+        this again won't change anything until a new advert arrives, so we
+        record last_seen in idle_last_seen and skip the work until then.
         """
+        if self.idle_last_seen == self.last_seen:
+            return
+        if nowstamp is None:
+            nowstamp = MONOTONIC_TIME()
+        idle = True
+        stale_stamp = nowstamp - DISTANCE_TIMEOUT
         # Run calculate_data on each child scanner of this device:
         for scanner in self.scanners.values():
             if isinstance(scanner, BermudaDeviceScanner):
                 # in issue #355 someone had an empty dict instead of a scanner object.
                 # it may be due to a race condition during startup, but we check now
                 # just in case. Was not able to reproduce.
-                scanner.calculate_data()
+                scanner.calculate_data(nowstamp)
+                if scanner.rssi_distance is not None or (scanner.stamp is not None and scanner.stamp >= stale_stamp):
+                    idle = False
             else:
                 _LOGGER_SPAM_LESS.error(
                     "scanner_not_instance", "Scanner device is not a BermudaDevice instance, skipping."
@@ -211,16 +275,18 @@ class BermudaDevice(dict):
         # Update whether this device has been seen recently, for device_tracker:
         if (
             self.last_seen is not None
-            and MONOTONIC_TIME() - self.options.get(CONF_DEVTRACK_TIMEOUT, DEFAULT_DEVTRACK_TIMEOUT) < self.last_seen
+            and nowstamp - self.options.get(CONF_DEVTRACK_TIMEOUT, DEFAULT_DEVTRACK_TIMEOUT) < self.last_seen
         ):
             self.zone = STATE_HOME
         else:
             self.zone = STATE_NOT_HOME
 
-        if self.address.upper() in self.options.get(CONF_DEVICES, []):
+        if self.is_configured:
             # We are a device we track. Flag for set-up:
             self.create_sensor = True
 
+        self.idle_last_seen = self.last_seen if idle and self.zone == STATE_NOT_HOME else None
+
     def update_scanner(self, scanner_device: BermudaDevice, discoveryinfo: BluetoothScannerDevice):
         """
         Add/Update a scanner entry on this device, indicating a received advertisement.
@@ -230,24 +296,26 @@ class BermudaDevice(dict):
         with calculate_data()
 
         """
-        if format_mac(scanner_device.address) in self.scanners:
+        scanner_address = mac_norm(scanner_device.address)
+        device_scanner = self.scanners.get(scanner_address)
+        if device_scanner is not None:
             # Device already exists, update it
-            self.scanners[format_mac(scanner_device.address)].update_advertisement(
+            device_scanner.update_advertisement(
                 discoveryinfo,  # the entire BluetoothScannerDevice struct
             )
-            device_scanner = self.scanners[format_mac(scanner_device.address)]
         else:
             # Create it
-            self.scanners[format_mac(scanner_device.address)] = BermudaDeviceScanner(
+            self.scanners[scanner_address] = device_scanner = BermudaDeviceScanner(
                 self,
                 discoveryinfo,  # the entire BluetoothScannerDevice struct
                 self.options,
                 scanner_device,
             )
-            device_scanner = self.scanners[format_mac(scanner_device.address)]
             # On first creation, we also want to copy our ref_power to it (but not afterwards,
             # since a metadevice might take over that role later)
             device_scanner.ref_power = self.ref_power
+        # Even an advert older than last_seen needs processing.
+        self.idle_last_seen = None
         # Let's see if we should update our last_seen based on this...
         if device_scanner.stamp is not None and self.last_seen < device_scanner.stamp:
             self.last_seen = device_scanner.stamp
@@ -255,13 +323,13 @@ class BermudaDevice(dict):
     def to_dict(self):
         """Convert class to serialisable dict for dump_devices."""
         out = {}
-        for var, val in vars(self).items():
+        for var in self.__slots__:
+            val = getattr(self, var)
             if var == "scanners":
                 scanout = {}
                 for address, scanner in self.scanners.items():
                     scanout[address] = scanner.to_dict()
-                # FIXME: val is overwritten
-                val = scanout  # noqa
+                val = scanout
             out[var] = val
         return out
 
@@ -9,6 +9,7 @@ to the combination of the scanner and the device it is reporting.
 
 from __future__ import annotations
 
+from itertools import islice
 from typing import TYPE_CHECKING, cast
 
 from homeassistant.components.bluetooth import (
@@ -20,7 +21,6 @@ from homeassistant.components.bluetooth import (
 from .const import (
     _LOGGER,
     CONF_ATTENUATION,
-    CONF_DEVICES,
     CONF_MAX_VELOCITY,
     CONF_REF_POWER,
     CONF_RSSI_OFFSETS,
@@ -54,6 +54,43 @@ class BermudaDeviceScanner(dict):
 
     """
 
+    # One of these for every device/scanner pairing, so avoid a per-instance __dict__.
+    # Kept in __init__ order, which to_dict() uses for the dump output.
+    __slots__ = (  # noqa: RUF023
+        "name",
+        "scanner_device",
+        "adapter",
+        "address",
+        "source",
+        "area_id",
+        "area_name",
+        "parent_device",
+        "parent_device_address",
+        "parent_device_address_upper",
+        "options",
+        "stamp",
+        "scanner_sends_stamps",
+        "new_stamp",
+        "rssi",
+        "tx_power",
+        "rssi_distance",
+        "rssi_distance_raw",
+        "ref_power",
+        "stale_update_count",
+        "hist_stamp",
+        "hist_rssi",
+        "hist_distance",
+        "hist_distance_by_interval",
+        "hist_interval",
+        "hist_velocity",
+        "conf_rssi_offset",
+        "conf_ref_power",
+        "conf_attenuation",
+        "conf_max_velocity",
+        "conf_smoothing_samples",
+        "adverts",
+    )
+
     def __init__(
         self,
         parent_device: BermudaDevice,  # The device being tracked
@@ -72,6 +109,8 @@ class BermudaDeviceScanner(dict):
         self.area_name: str | None = scanner_device.area_name
         self.parent_device = parent_device
         self.parent_device_address = parent_device.address
+        # Remote scanners' stamps are keyed by upper-cased mac.
+        self.parent_device_address_upper = parent_device.address.upper()
         self.options = options
         self.stamp: float | None = 0
         # Only remote scanners log timestamps, local usb adaptors do not.
@@ -130,10 +169,11 @@ class BermudaDeviceScanner(dict):
             stamps = scanner._discovered_device_timestamps  # type: ignore #noqa
 
             # In this dict all MAC address keys are upper-cased
-            uppermac = self.parent_device_address.upper()
-            if uppermac in stamps:
-                if self.stamp is None or (stamps[uppermac] is not None and stamps[uppermac] > self.stamp):
-                    new_stamp = stamps[uppermac]
+            uppermac = self.parent_device_address_upper
+            adstamp = stamps.get(uppermac)
+            if adstamp is not None or uppermac in stamps:
+                if self.stamp is None or (adstamp is not None and adstamp > self.stamp):
+                    new_stamp = adstamp
                 else:
                     # We have no updated advert in this run.
                     new_stamp = None
@@ -279,7 +319,7 @@ class BermudaDeviceScanner(dict):
             return self._update_raw_distance(False)
         return self.rssi_distance_raw
 
-    def calculate_data(self):
+    def calculate_data(self, nowstamp: float | None = None):
         """
         Filter and update distance estimates.
 
@@ -320,7 +360,12 @@ class BermudaDeviceScanner(dict):
         "away" from a scanner when it hears no new adverts. DISTANCE_TIMEOUT
         is how we decide how long to wait, and should accommodate for dropped
         packets and for temporary occlusion (dogs' bodies etc)
+
+        nowstamp may be passed in by the caller so that a whole update cycle
+        shares one MONOTONIC_TIME() reading.
         """
+        if nowstamp is None:
+            nowstamp = MONOTONIC_TIME()
         new_stamp = self.new_stamp  # should have been set by update()
         self.new_stamp = None  # Clear so we know if an update is missed next cycle
 
@@ -333,7 +378,7 @@ class BermudaDeviceScanner(dict):
 
             self.hist_distance_by_interval = [self.rssi_distance_raw]
 
-        elif new_stamp is None and (self.stamp is None or self.stamp < MONOTONIC_TIME() - DISTANCE_TIMEOUT):
+        elif new_stamp is None and (self.stamp is None or self.stamp < nowstamp - DISTANCE_TIMEOUT):
             # DEVICE IS AWAY!
             # Last distance reading is stale, mark device distance as unknown.
             self.rssi_distance = None
@@ -344,25 +389,34 @@ class BermudaDeviceScanner(dict):
         else:
             # Add the current reading (whether new or old) to
             # a historical log that is evenly spaced by update_interval.
+            # The lists are only mutated in place below, so bind them (and
+            # the raw reading) to locals once rather than per access.
+            hist_distance = self.hist_distance
+            hist_stamp = self.hist_stamp
+            hist_distance_by_interval = self.hist_distance_by_interval
+            rssi_distance_raw = self.rssi_distance_raw
 
             # Verify the new reading is vaguely sensible. If it isn't, we
             # ignore it by duplicating the last cycle's reading.
-            if len(self.hist_stamp) > 1:
+            if len(hist_stamp) > 1:
                 # How far (away) did it travel in how long?
                 # we check this reading against the recent readings to find
                 # the peak average velocity we are alleged to have reached.
-                velo_newdistance = self.hist_distance[0]
-                velo_newstamp = self.hist_stamp[0]
+                velo_newdistance = hist_distance[0]
+                velo_newstamp = hist_stamp[0]
                 peak_velocity = 0
                 # walk through the history of distances/stamps, and find
                 # the peak
-                delta_t = velo_newstamp - self.hist_stamp[1]
-                delta_d = velo_newdistance - self.hist_distance[1]
+                delta_t = velo_newstamp - hist_stamp[1]
+                delta_d = velo_newdistance - hist_distance[1]
                 if delta_t > 0:
                     peak_velocity = delta_d / delta_t
                 # if our initial reading is an approach, we are done here
                 if peak_velocity >= 0:
-                    for old_distance, old_stamp in zip(self.hist_distance[2:], self.hist_stamp[2:], strict=False):
+                    # islice walks the histories in place rather than copying them with [2:]
+                    for old_distance, old_stamp in zip(
+                        islice(hist_distance, 2, None), islice(hist_stamp, 2, None), strict=False
+                    ):
                         if old_stamp is None:
                             continue  # Skip this iteration if hist_stamp[i] is None
 
@@ -389,23 +443,22 @@ class BermudaDeviceScanner(dict):
             self.hist_velocity.insert(0, velocity)
 
             if velocity > self.conf_max_velocity:
-                if self.parent_device_address.upper() in self.options.get(CONF_DEVICES, []):
+                if self.parent_device.is_configured:
                     _LOGGER.debug(
                         "This sparrow %s flies too fast (%2fm/s), ignoring",
                         self.parent_device_address,
                         velocity,
                     )
                 # Discard the bogus reading by duplicating the last.
-                if len(self.hist_distance_by_interval) == 0:
-                    self.hist_distance_by_interval = [self.rssi_distance_raw]
+                if len(hist_distance_by_interval) == 0:
+                    hist_distance_by_interval.append(rssi_distance_raw)
                 else:
-                    self.hist_distance_by_interval.insert(0, self.hist_distance_by_interval[0])
+                    hist_distance_by_interval.insert(0, hist_distance_by_interval[0])
             else:
-                self.hist_distance_by_interval.insert(0, self.hist_distance_by_interval[0])
+                hist_distance_by_interval.insert(0, hist_distance_by_interval[0])
 
             # trim the log to length
-            if len(self.hist_distance_by_interval) > self.conf_smoothing_samples:
-                del self.hist_distance_by_interval[self.conf_smoothing_samples :]
+            del hist_distance_by_interval[self.conf_smoothing_samples :]
 
             # Calculate a moving-window average, that only includes
             # historical values if they're "closer" (ie more reliable).
@@ -417,21 +470,21 @@ class BermudaDeviceScanner(dict):
             # helpful, but probably dependent on use-case.
             #
             dist_total: float = 0
-            local_min: float = self.rssi_distance_raw or DISTANCE_INFINITE
-            for distance in self.hist_distance_by_interval:
+            local_min: float = rssi_distance_raw or DISTANCE_INFINITE
+            for distance in hist_distance_by_interval:
                 if distance is not None and distance <= local_min:
                     local_min = distance
                 dist_total += local_min
 
-            if (_hist_dist_len := len(self.hist_distance_by_interval)) > 0:
+            if (_hist_dist_len := len(hist_distance_by_interval)) > 0:
                 movavg = dist_total / _hist_dist_len
             else:
                 movavg = local_min
             # The average is only helpful if it's lower than the actual reading.
-            if self.rssi_distance_raw is None or movavg < self.rssi_distance_raw:
+            if rssi_distance_raw is None or movavg < rssi_distance_raw:
                 self.rssi_distance = movavg
             else:
-                self.rssi_distance = self.rssi_distance_raw
+                self.rssi_distance = rssi_distance_raw
 
         # Trim our history lists
         del self.hist_distance[HIST_KEEP_COUNT:]
@@ -443,7 +496,8 @@ class BermudaDeviceScanner(dict):
     def to_dict(self):
         """Convert class to serialisable dict for dump_devices."""
         out = {}
-        for var, val in vars(self).items():
+        for var in self.__slots__:
+            val = getattr(self, var)
             if var in ["options", "parent_device", "scanner_device"]:
                 # skip certain vars that we don't want in the dump output.
                 continue
@@ -163,7 +163,7 @@ class BermudaOptionsFlowHandler(OptionsFlowWithConfigEntry):
             messages["status"] = "You have at least some active devices, this is good."
 
         # Build a markdown table of scanners so the user can see what's up.
-        scanner_table = "\n\nStatus of scanners:\n\n|Scanner|Address|Last advertisement|\n|---|---|---:|\n"
+        scanner_table = ["\n\nStatus of scanners:\n\n|Scanner|Address|Last advertisement|\n|---|---|---:|\n"]
         # Use emoji to indicate if age is "good"
         for scanner in self.coordinator.get_active_scanner_summary():
             age = int(scanner.get("last_stamp_age", 999))
@@ -174,11 +174,11 @@ class BermudaOptionsFlowHandler(OptionsFlowWithConfigEntry):
             else:
                 status = '<ha-icon icon="mdi:skull-crossbones"></ha-icon>'
 
-            scanner_table += (
+            scanner_table.append(
                 f"| {scanner.get("name", "NAME_ERR")}| [{scanner.get("address", "ADDR_ERR")}]"
                 f"| {status} {int(scanner.get("last_stamp_age", DISTANCE_INFINITE)):d} seconds ago.|\n"
             )
-        messages["status"] += scanner_table
+        messages["status"] += "".join(scanner_table)
 
         # return await self.async_step_globalopts()
         return self.async_show_menu(
@@ -430,22 +430,21 @@ class BermudaOptionsFlowHandler(OptionsFlowWithConfigEntry):
 
             # Build a markdown table showing distance and rssi history for the
             # selected device / scanner combination
-            results_str = f"| {device.name} |"
             # Limit the number of columns to what's available up to a max of 5.
             cols = min(5, len(distances), len(scanner.hist_rssi))
-            for i in range(cols):
-                results_str += f" {i} |"
-            results_str += "\n|---|"
-            for i in range(cols):  # noqa for unused var i
-                results_str += "---:|"
-
-            results_str += "\n| Estimate (m) |"
-            for i in range(cols):
-                results_str += f" `{distances[i]:>5.2f}`|"
-            results_str += "\n| RSSI Actual |"
-            for i in range(cols):
-                results_str += f" `{scanner.hist_rssi[i]:>5}`|"
-            results_str += "\n"
+            results_str = "".join(
+                (
+                    f"| {device.name} |",
+                    *(f" {i} |" for i in range(cols)),
+                    "\n|---|",
+                    "---:|" * cols,
+                    "\n| Estimate (m) |",
+                    *(f" `{distances[i]:>5.2f}`|" for i in range(cols)),
+                    "\n| RSSI Actual |",
+                    *(f" `{scanner.hist_rssi[i]:>5}`|" for i in range(cols)),
+                    "\n",
+                )
+            )
 
         return self.async_show_form(
             step_id="calibration1_global",
@@ -537,16 +536,17 @@ class BermudaOptionsFlowHandler(OptionsFlowWithConfigEntry):
                         for historical_rssi in device.scanners[scanner].hist_rssi
                     ]
             # Format the results for display (HA has full markdown support!)
-            results_str = "| Scanner | 0 | 1 | 2 | 3 | 4 |\n|---|---:|---:|---:|---:|---:|"
+            results_parts = ["| Scanner | 0 | 1 | 2 | 3 | 4 |\n|---|---:|---:|---:|---:|---:|"]
             for scanner_name, distances in results.items():
-                results_str += f"\n|{scanner_name}|"
+                results_parts.append(f"\n|{scanner_name}|")
                 for i in range(5):
                     # We round to 2 places (1cm) and pad to fit nn.nn
                     try:
-                        results_str += f" `{distances[i]:>6.2f}`|"
+                        results_parts.append(f" `{distances[i]:>6.2f}`|")
                     except IndexError:
-                        results_str += "`-`|"
-            results_str += "\n\n"
+                        results_parts.append("`-`|")
+            results_parts.append("\n\n")
+            results_str = "".join(results_parts)
 
         return self.async_show_form(
             step_id="calibration2_scanners",
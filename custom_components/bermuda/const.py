@@ -94,6 +94,8 @@ PRUNE_TIME_IRK = 3600  # Resolvable Private addresses change often, prune regula
 
 SAVEOUT_COOLDOWN = 10  # seconds to delay before re-trying config entry save.
 
+REDACT_CACHE_MAX = 4096  # How many redacted strings to remember between redaction list changes
+
 DOCS = {}
 
 
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import heapq
+import logging
 import re
+import sys
+from collections import Counter
 from collections.abc import Callable
 from datetime import datetime, timedelta
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
@@ -42,10 +47,13 @@ from homeassistant.helpers import (
 from homeassistant.helpers import (
     entity_registry as er,
 )
+from homeassistant.helpers.area_registry import (
+    EVENT_AREA_REGISTRY_UPDATED,
+    EventAreaRegistryUpdatedData,
+)
 from homeassistant.helpers.device_registry import (
     EVENT_DEVICE_REGISTRY_UPDATED,
     EventDeviceRegistryUpdatedData,
-    format_mac,
 )
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later
@@ -87,11 +95,12 @@ from .const import (
     PRUNE_TIME_DEFAULT,
     PRUNE_TIME_INTERVAL,
     PRUNE_TIME_IRK,
+    REDACT_CACHE_MAX,
     SAVEOUT_COOLDOWN,
     SIGNAL_DEVICE_NEW,
     UPDATE_INTERVAL,
 )
-from .util import clean_charbuf
+from .util import clean_charbuf, mac_norm, scanner_devreg_connections
 
 if TYPE_CHECKING:
     from habluetooth import BluetoothServiceInfoBleak
@@ -102,6 +111,75 @@ if TYPE_CHECKING:
 
 Cancellable = Callable[[], None]
 
+# libyaml's loader is much faster, but PyYAML can be built without it.
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader  # type: ignore[assignment]
+
+# Leaf types that redact_data passes through untouched. Most non-string values
+# in a dump are one of these, so they are checked before any isinstance calls.
+REDACT_PASSTHROUGH_TYPES = frozenset((bool, int, float, type(None)))
+
+# The scanner fields we save out to the config entry's data.
+CONFDATA_SCANNER_KEYS = (
+    "name",
+    "local_name",
+    "prefname",
+    "address",
+    "ref_power",
+    "unique_id",
+    "address_type",
+    "area_id",
+    "area_name",
+    "is_scanner",
+    "entry_id",
+)
+
+# Source device attributes that update_metadevices copies to a metadevice. BermudaDevice
+# has __slots__, so these are always present.
+# Defaults, only copied if the metadevice doesn't already have something better:
+METADEVICE_DEFAULT_ATTRS = (
+    # "create_sensor",  # don't copy this, maybe we're tracking the device alone
+    "local_name",  # names we copy if there isn't one already.
+    "manufacturer",
+    "name",
+    # "options",
+    "prefname",
+)
+# INTERESTING, always overwritten:
+METADEVICE_INTERESTING_ATTRS = (
+    "area_distance",
+    "area_id",
+    "area_name",
+    "area_rssi",
+    "area_scanner",
+    "beacon_major",
+    "beacon_minor",
+    "beacon_power",
+    "beacon_unique_id",
+    "beacon_uuid",
+    "connectable",
+    "zone",
+)
+
+# The config entry options we copy into self.options.
+CONF_OPTION_KEYS = frozenset(
+    (
+        CONF_ATTENUATION,
+        CONF_DEVICES,
+        CONF_DEVTRACK_TIMEOUT,
+        CONF_MAX_RADIUS,
+        CONF_MAX_VELOCITY,
+        CONF_REF_POWER,
+        CONF_SMOOTHING_SAMPLES,
+        CONF_RSSI_OFFSETS,
+    )
+)
+
+# Sort key for picking the closest scanner in _refresh_area_by_min_distance.
+_rssi_distance_key = attrgetter("rssi_distance")
+
 
 class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
     """
@@ -136,12 +214,27 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         # match/replacement pairs for redacting addresses
         self.redactions: dict[str, str] = {}
         # Any remaining MAC addresses will be replaced with this. We define it here
-        # so we can compile it once.
-        self._redact_generic_re = re.compile(r"(?P<start>[0-9A-Fa-f]{2}):([0-9A-Fa-f]{2}:){4}(?P<end>[0-9A-Fa-f]{2})")
-        self._redact_generic_sub = r"\g<start>:xx:xx:xx:xx:\g<end>"
+        # so we can compile it once. Strings are always lowercased before matching,
+        # and the middle octets aren't kept, so don't bother capturing them.
+        self._redact_generic_re = re.compile(r"(?P<start>[0-9a-f]{2}):(?:[0-9a-f]{2}:){4}(?P<end>[0-9a-f]{2})")
+        # All the redaction keys and the generic pattern as a single alternation, so
+        # each string only needs one pass. Rebuilt whenever the redactions change.
+        self._redact_re: re.Pattern = self._redact_generic_re
+        self._redact_re_sub = self._redact_re.sub  # bound once, used for every string
+        self._redact_count: int = 0
+        # Strings shorter than this can't contain anything that _redact_re matches.
+        self._redact_min_len: int = 17
+        # Redacted strings, and how often each has been asked for. A few names and
+        # addresses make up most of any dump, so the cache evicts by use count
+        # rather than by age. Only valid for the current redactions, so it is
+        # emptied whenever they change.
+        self._redact_cache: dict[str, str] = {}
+        self._redact_cache_hits: Counter[str] = Counter()
 
         self.stamp_last_update: float = 0  # Last time we ran an update, from MONOTONIC_TIME()
         self.stamp_last_prune: float = 0  # When we last pruned device list
+        self.stamp_last_update_started: float = 0  # When an advert last kicked off an update
+        self._active_device_count: int = 0  # Devices seen in the 10s before the last update
 
         self.member_uuids = {}
 
@@ -154,7 +247,7 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         )
 
         self._manager: HomeAssistantBluetoothManager = _get_manager(hass)  # instance of the bluetooth manager
-        self._hascanners: set[BaseHaScanner]  # Links to the backend scanners
+        self._hascanners: set[BaseHaScanner] = set()  # Links to the backend scanners
         self._hascanner_timestamps: dict[str, dict[str, float]] = {}  # scanner_address, device_address, stamp
 
         self._entity_registry = er.async_get(self.hass)
@@ -168,13 +261,16 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
 
         self._ad_listener_cancel: Cancellable | None = None
 
-        # Tracks the last stamp that we *actually* saved our config entry. Mostly for debugging,
-        # we use a request stamp for tracking our add_job request.
+        # Tracks the last stamp that we *actually* saved our config entry. Mostly for debugging.
         self.last_config_entry_update: float = 0  # Stamp of last *save-out* of config.data
 
-        # We want to delay the first save-out, since it takes a few seconds for things
-        # to stabilise. So set the stamp into the future.
-        self.last_config_entry_update_request = MONOTONIC_TIME() + SAVEOUT_COOLDOWN  # Stamp for save-out requests
+        # Save-outs are debounced: changes are parked here and a single timer
+        # writes out whatever is latest once SAVEOUT_COOLDOWN has passed. This
+        # also delays the first save-out, since it takes a few seconds for things
+        # to stabilise.
+        self._pending_confdata_scanners: dict[str, dict] | None = None
+        self._saveout_cancel: Cancellable | None = None
+        entry.async_on_unload(self._async_cancel_saveout)
 
         self.hass.bus.async_listen(EVENT_STATE_CHANGED, self.handle_state_changes)
 
@@ -190,6 +286,11 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         # Primarily for changes to scanners and Private BLE Devices.
         hass.bus.async_listen(EVENT_DEVICE_REGISTRY_UPDATED, self.handle_devreg_changes)
 
+        # Area names for scanners' area_ids, since they rarely change. Cleared
+        # whenever the area registry is updated.
+        self._area_name_cache: dict[str, str | None] = {}
+        hass.bus.async_listen(EVENT_AREA_REGISTRY_UPDATED, self.handle_areareg_changes)
+
         self.options = {}
 
         # TODO: This is only here because we haven't set up migration of config
@@ -203,28 +304,21 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         self.options[CONF_UPDATE_INTERVAL] = DEFAULT_UPDATE_INTERVAL
         self.options[CONF_RSSI_OFFSETS] = {}
 
-        if hasattr(entry, "options"):
-            # Firstly, on some calls (specifically during reload after settings changes)
-            # we seem to get called with a non-existant config_entry.
-            # Anyway... if we DO have one, convert it to a plain dict so we can
-            # serialise it properly when it goes into the device and scanner classes.
-            for key, val in entry.options.items():
-                if key in (
-                    CONF_ATTENUATION,
-                    CONF_DEVICES,
-                    CONF_DEVTRACK_TIMEOUT,
-                    CONF_MAX_RADIUS,
-                    CONF_MAX_VELOCITY,
-                    CONF_REF_POWER,
-                    CONF_SMOOTHING_SAMPLES,
-                    CONF_RSSI_OFFSETS,
-                ):
-                    self.options[key] = val
+        # Convert the options we use to a plain dict so we can serialise
+        # it properly when it goes into the device and scanner classes.
+        entry_options = entry.options
+        for key in CONF_OPTION_KEYS & entry_options.keys():
+            self.options[key] = entry_options[key]
 
         self.devices: dict[str, BermudaDevice] = {}
         # self.updaters: dict[str, BermudaPBDUCoordinator] = {}
         self._has_purged = False
-        self._purge_task = hass.loop.call_soon_threadsafe(hass.async_create_task, self.purge_redactions(hass))
+        self._purge_task = None
+        # We're already in the event loop, so no need for call_soon_threadsafe.
+        purge_task = hass.async_create_task(self.purge_redactions(hass))
+        if not self._has_purged:
+            # The task didn't run eagerly, keep it so stop_purging can cancel it.
+            self._purge_task = purge_task
         self.area_reg = ar.async_get(hass)
 
         # Restore the scanners saved in config entry data. We maintain
@@ -232,14 +326,25 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         # restore the sensor states even if we don't have a full set of
         # scanner receipts in the discovery data.
         self.scanner_list: list[str] = []
+        # Devices flagged is_scanner, keyed by address and kept in step with
+        # that flag so we don't need to trawl every device to find the scanners.
+        self._scanners: dict[str, BermudaDevice] = {}
+        # Snapshot of the saved scanner fields, last time they matched the config entry
+        self._confdata_scanners_snapshot: tuple | None = None
+        # Per-scanner confdata dicts, along with the field values they were built from
+        self._confdata_scanner_dicts: dict[str, tuple[tuple, dict]] = {}
         if hasattr(entry, "data"):
             for address, saved in entry.data.get(CONFDATA_SCANNERS, {}).items():
                 scanner = self._get_or_create_device(address)
                 for key, value in saved.items():
-                    if key != "options":
+                    if key != "options" and hasattr(scanner, key):
                         # We don't restore the options, since they may have changed.
                         # the get_or_create will have grabbed the current ones.
+                        # Devices have fixed attributes, so skip any unknown keys
+                        # that an older version may have saved.
                         setattr(scanner, key, value)
+                if scanner.is_scanner:
+                    self._scanners[scanner.address] = scanner
                 self.scanner_list.append(address)
 
         # Register the dump_devices service
@@ -273,8 +378,10 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         file_path = Path(__file__).parent / "manufacturer_identification" / "member_uuids.yaml"
 
         with file_path.open("r") as f:
-            member_uuids_yaml = yaml.safe_load(f)["uuids"]
-        self.member_uuids = {hex(member["uuid"])[2:]: member["name"] for member in member_uuids_yaml}
+            member_uuids_yaml = yaml.load(f, Loader=YamlSafeLoader)["uuids"]
+        # Many members share a name, so intern them to keep just one copy of each.
+        intern = sys.intern
+        self.member_uuids = {hex(member["uuid"])[2:]: intern(member["name"]) for member in member_uuids_yaml}
 
     @callback
     def handle_state_changes(self, ev: Event[EventStateChangedData]):
@@ -305,6 +412,13 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
                             # breaks
                             self.hass.add_job(self.async_refresh())
 
+    @callback
+    def handle_areareg_changes(self, ev: Event[EventAreaRegistryUpdatedData]):
+        """Forget cached area names and refresh the scanners if any area changes."""
+        _LOGGER.debug("Area registry has changed. ev: %s", ev)
+        self._area_name_cache.clear()
+        self._do_full_scanner_init = True
+
     @callback
     def handle_devreg_changes(self, ev: Event[EventDeviceRegistryUpdatedData]):
         """
@@ -330,17 +444,15 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
 
             if device is not None:
                 # Work out if it's a device that interests us and respond appropriately.
-                for conn_type, _conn_id in device.connections:
-                    if conn_type == "private_ble_device":
-                        _LOGGER.debug("Trigger updating of Private BLE Devices")
-                        self._do_private_device_init = True
-                    elif conn_type == "ibeacon":
-                        # this was probably us, nothing else to do
-                        pass
-                    else:
-                        # might be a scanner, so let's refresh those
-                        _LOGGER.debug("Trigger updating of Scanner Listings")
-                        self._do_full_scanner_init = True
+                conn_types = {conn_type for conn_type, _conn_id in device.connections}
+                if "private_ble_device" in conn_types:
+                    _LOGGER.debug("Trigger updating of Private BLE Devices")
+                    self._do_private_device_init = True
+                # ibeacon connections were probably us, nothing else to do. Anything
+                # else might be a scanner, so let's refresh those.
+                if conn_types - {"private_ble_device", "ibeacon"}:
+                    _LOGGER.debug("Trigger updating of Scanner Listings")
+                    self._do_full_scanner_init = True
             else:
                 _LOGGER.error(
                     "Received DR update/create but device id does not exist: %s",
@@ -349,11 +461,12 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
 
         elif ev.data["action"] == "remove":
             device_found = False
-            for scanner in self.scanner_list:
-                if self.devices[scanner].entry_id == ev.data["device_id"]:
+            device_id = ev.data["device_id"]
+            for scanner in self._scanners.values():
+                if scanner.entry_id == device_id:
                     _LOGGER.debug(
                         "Scanner %s removed, trigger update of scanners.",
-                        self.devices[scanner].name,
+                        scanner.name,
                     )
                     self._do_full_scanner_init = True
                     device_found = True
@@ -399,20 +512,21 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         # initial setup, then no sensors will be created, and no updates will
         # be triggered on the co-ordinator. So let's check if we haven't updated
         # recently, and do so...
-        if self.stamp_last_update < MONOTONIC_TIME() - (UPDATE_INTERVAL * 2):
+        # The job won't run until after this callback returns, so also check when we
+        # last kicked one off, or a burst of adverts would queue up an update each.
+        nowstamp = MONOTONIC_TIME()
+        if (
+            self.stamp_last_update < nowstamp - (UPDATE_INTERVAL * 2)
+            and self.stamp_last_update_started < nowstamp - UPDATE_INTERVAL
+        ):
+            self.stamp_last_update_started = nowstamp
             self.hass.add_job(self._async_update_data())
 
     def _check_all_platforms_created(self, address):
         """Checks if all platforms have finished loading a device's entities."""
         dev = self._get_device(address)
         if dev is not None:
-            if all(
-                [
-                    dev.create_sensor_done,
-                    dev.create_tracker_done,
-                    dev.create_number_done,
-                ]
-            ):
+            if dev.create_sensor_done and dev.create_tracker_done and dev.create_number_done:
                 dev.create_all_done = True
 
     def sensor_created(self, address):
@@ -455,22 +569,37 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
 
         Useful as a general indicator of health
         """
-        stamp = MONOTONIC_TIME() - 10  # seconds
-        fresh_count = 0
-        for device in self.devices.values():
-            if device.last_seen > stamp:
-                fresh_count += 1
-        return fresh_count
+        # Counted during each update's pass over the devices (metadevices just
+        # after update_metadevices), so we don't need another trip through them here.
+        return self._active_device_count
 
     def count_active_scanners(self, max_age=10) -> int:
         """Returns count of scanners that have recently sent updates."""
         stamp = MONOTONIC_TIME() - max_age  # seconds
         fresh_count = 0
-        for scanner in self.get_active_scanner_summary():
-            if scanner.get("last_stamp", 0) > stamp:
+        for last_stamp in self._get_scanner_last_stamps().values():
+            if last_stamp > stamp:
                 fresh_count += 1
         return fresh_count
 
+    def _get_scanner_last_stamps(self) -> dict[str, float]:
+        """
+        Returns the most recent advert stamp seen by each configured scanner.
+
+        Done in a single pass over the devices, rather than a pass per scanner.
+        """
+        last_stamps: dict[str, float] = dict.fromkeys(self.scanner_list, 0)
+        for device in self.devices.values():
+            for scanner_address, record in device.scanners.items():
+                record_stamp = record.stamp
+                if (
+                    record_stamp is not None
+                    and scanner_address in last_stamps
+                    and record_stamp > last_stamps[scanner_address]
+                ):
+                    last_stamps[scanner_address] = record_stamp
+        return last_stamps
+
     def get_active_scanner_summary(self) -> list[dict]:
         """
         Returns a list of dicts suitable for seeing which scanners
@@ -478,14 +607,11 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         each has returned an advertisement.
         """
         stamp = MONOTONIC_TIME()
+        last_stamps = self._get_scanner_last_stamps()
         results = []
         for scanner in self.scanner_list:
             scannerdev = self.devices[scanner]
-            last_stamp: float = 0
-            for device in self.devices.values():
-                record = device.scanners.get(scanner, None)
-                if record is not None and record.stamp is not None:
-                    last_stamp = max(record.stamp, last_stamp)
+            last_stamp = last_stamps[scanner]
             results.append(
                 {
                     "name": scannerdev.name,
@@ -498,17 +624,22 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
 
     def _get_device(self, address: str) -> BermudaDevice | None:
         """Search for a device entry based on mac address."""
-        mac = format_mac(address).lower()
-        # format_mac tries to return a lower-cased, colon-separated mac address.
-        # failing that, it returns the original unaltered.
-        if mac in self.devices:
-            return self.devices[mac]
-        return None
+        # Internal callers mostly pass addresses we already normalised,
+        # so try a straight lookup before normalising it.
+        device = self.devices.get(address)
+        if device is not None:
+            return device
+        # mac_norm returns a lower-cased, colon-separated mac address,
+        # failing that, the original lower-cased.
+        return self.devices.get(mac_norm(address))
 
     def _get_or_create_device(self, address: str) -> BermudaDevice:
-        device = self._get_device(address)
+        device = self.devices.get(address)
+        if device is not None:
+            return device
+        mac = mac_norm(address)
+        device = self.devices.get(mac)
         if device is None:
-            mac = format_mac(address).lower()
             self.devices[mac] = device = BermudaDevice(address=mac, options=self.options)
             device.address = mac
             device.unique_id = mac
@@ -522,13 +653,21 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         (no network requests made etc).
 
         """
-        for service_info in bluetooth.async_discovered_service_info(self.hass, False):
+        nowstamp = MONOTONIC_TIME()
+
+        # Bind the lookups we make for every advert and every device once, up front.
+        hass = self.hass
+        get_or_create_device = self._get_or_create_device
+        get_device = self._get_device
+        scanner_devices_by_address = bluetooth.async_scanner_devices_by_address
+
+        for service_info in bluetooth.async_discovered_service_info(hass, False):
             # Note that some of these entries are restored from storage,
             # so we won't necessarily find (immediately, or perhaps ever)
             # scanner entries for any given device.
 
             # Get/Create a device entry
-            device = self._get_or_create_device(service_info.address)
+            device = get_or_create_device(service_info.address)
 
             # Check if it's broadcasting an Apple Inc manufacturing data (ID: 0x004C)
             for (
@@ -638,16 +777,18 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
                 device.prefname = device.name or device.local_name or f"{default_prefix}_{slugify(device.address)}"
 
             # Work through the scanner entries...
-            matched_scanners = bluetooth.async_scanner_devices_by_address(self.hass, service_info.address, False)
+            matched_scanners = scanner_devices_by_address(hass, service_info.address, False)
             for discovered in matched_scanners:
-                scanner_device = self._get_device(discovered.scanner.source)
-                if scanner_device is None:
+                scanner_device = get_device(discovered.scanner.source)
+                if scanner_device is None and self._ha_scanners_changed():
                     # The receiver doesn't have a device entry yet, let's refresh
-                    # all of them in this batch...
+                    # all of them in this batch... but only if HA's scanners have
+                    # changed since we last looked, otherwise we'd just repeat the
+                    # same (failed) lookup for every advert the scanner sends.
                     self._do_full_scanner_init = True  # Flag that we need a full init
                     self._do_private_device_init = True
                     self._refresh_scanners(matched_scanners)
-                    scanner_device = self._get_device(discovered.scanner.source)
+                    scanner_device = get_device(discovered.scanner.source)
 
                 if scanner_device is None:
                     # Highly unusual. If we can't find an entry for the scanner
@@ -674,13 +815,20 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         if self.stamp_last_update == 0:
             # First run, let's do it.
             for _source_address in self.options.get(CONF_DEVICES, []):
-                self._get_or_create_device(_source_address)
+                get_or_create_device(_source_address)
 
         # Scanner entries have been loaded up with latest data, now we can
         # process data for all devices over all scanners.
+        fresh_stamp = nowstamp - 10  # seconds, for count_active_devices
+        fresh_count = 0
+        calculate_data = BermudaDevice.calculate_data
         for device in self.devices.values():
             # Recalculate smoothed distances, last_seen etc
-            device.calculate_data()
+            calculate_data(device, nowstamp)
+            # Metadevices are counted once update_metadevices has given them
+            # their sources' latest last_seen, below.
+            if device.last_seen > fresh_stamp and not device.is_metadevice:
+                fresh_count += 1
 
         self._refresh_areas_by_min_distance()
 
@@ -698,39 +846,55 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         # have had their updates done since any beacon inherits data from its source
         # device(s). We do this *before* sensor creation, though.
         self.update_metadevices()
+        self._active_device_count = fresh_count + sum(
+            1 for metadev in self.metadevices.values() if metadev.last_seen > fresh_stamp
+        )
 
         # The devices are all updated now (and any new scanners and beacons seen have been added),
         # so let's ensure any devices that we create sensors for are set up ready to go.
         # We don't do this sooner because we need to ensure we have every active scanner
         # already loaded up.
+        # They all go out in one signal, so each platform can add its entities in one batch.
+        new_addresses = []
         for address, device in self.devices.items():
-            if device.create_sensor:
-                if not device.create_all_done:
-                    _LOGGER.debug("Firing device_new for %s (%s)", device.name, address)
-                    # Note that the below should be OK thread-wise, debugger indicates this is being
-                    # called by _run in events.py, so pretty sure we are "in the event loop".
-                    async_dispatcher_send(self.hass, SIGNAL_DEVICE_NEW, address, self.scanner_list)
-
-        if self.stamp_last_prune < MONOTONIC_TIME() - PRUNE_TIME_INTERVAL:
+            if device.create_sensor and not device.create_all_done:
+                _LOGGER.debug("Firing device_new for %s (%s)", device.name, address)
+                new_addresses.append(address)
+        if new_addresses:
+            # Note that the below should be OK thread-wise, debugger indicates this is being
+            # called by _run in events.py, so pretty sure we are "in the event loop".
+            async_dispatcher_send(self.hass, SIGNAL_DEVICE_NEW, new_addresses, self.scanner_list)
+
+        if self.stamp_last_prune < nowstamp - PRUNE_TIME_INTERVAL:
             # (periodically) prune any stale device entries...
-            self.prune_devices()
-            self.stamp_last_prune = MONOTONIC_TIME()
+            self.prune_devices(nowstamp)
+            self.stamp_last_prune = nowstamp
 
         # end of async update
-        self.stamp_last_update = MONOTONIC_TIME()
+        self.stamp_last_update = nowstamp
         self.last_update_success = True
 
-    def prune_devices(self):
-        """Scan through all collected devices, and remove those that meet Pruning criteria."""
+    def prune_devices(self, nowstamp: float | None = None):
+        """
+        Scan through all collected devices, and remove those that meet Pruning criteria.
+
+        nowstamp is the update cycle's MONOTONIC_TIME(), read fresh if not given.
+        """
+        if nowstamp is None:
+            nowstamp = MONOTONIC_TIME()
+        stale_irk_stamp = nowstamp - PRUNE_TIME_IRK
+        stale_stamp = nowstamp - PRUNE_TIME_DEFAULT
         prune_list = []
         prunable_stamps = {}
 
         # build a set of source devices that are still beacon_sources[0]
-        metadevice_source_primos = set()
-        for metadevice in self.metadevices.values():
-            if len(metadevice.beacon_sources) > 0:
-                metadevice_source_primos.add(metadevice.beacon_sources[0])
+        metadevice_source_primos = {
+            metadevice.beacon_sources[0] for metadevice in self.metadevices.values() if metadevice.beacon_sources
+        }
 
+        prune_append = prune_list.append
+        # Saves building the log args for every stale device when not debugging.
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
         for device_address, device in self.devices.items():
             # Prune any devices that haven't been heard from for too long, but only
             # if we aren't actively tracking them and it's a traditional MAC address.
@@ -742,55 +906,63 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
             # - create_sensor
             # then it should be up for pruning. A stale iBeacon that we don't actually track
             # should totally be pruned if it's no longer around.
+            # Tests are ordered cheapest-first: plain flag reads before the
+            # set lookup, so tracked devices and scanners bail out early.
+            if device.create_sensor or device.is_scanner:  # Not if we track the device
+                continue
+            last_seen = device.last_seen
+            address_type = device.address_type
             if (
-                device_address not in metadevice_source_primos
-                and (not device.create_sensor)  # Not if we track the device
-                and (not device.is_scanner)
-                and (device.last_seen > 0)  # Don't prune if we haven't initialised yet!
-                and device.address_type != BDADDR_TYPE_NOT_MAC48
+                (last_seen > 0)  # Don't prune if we haven't initialised yet!
+                and address_type != BDADDR_TYPE_NOT_MAC48
+                and device_address not in metadevice_source_primos
             ):
-                if device.address_type == BDADDR_TYPE_PRIVATE_RESOLVABLE:
+                if address_type == BDADDR_TYPE_PRIVATE_RESOLVABLE:
                     # This is an IRK source address. We'll *only* want to keep
                     # if if belongs to one of our known Private BLE devices *and*
                     # it's the latest address we have for it.
 
-                    if device.last_seen < MONOTONIC_TIME() - PRUNE_TIME_IRK:
-                        _LOGGER.debug(
-                            "Marking stale IRK address for pruning: %s",
-                            device.name or device_address,
-                        )
-                        prune_list.append(device_address)
+                    if last_seen < stale_irk_stamp:
+                        if debug_enabled:
+                            _LOGGER.debug(
+                                "Marking stale IRK address for pruning: %s",
+                                device.name or device_address,
+                            )
+                        prune_append(device_address)
                     else:
                         # It's not stale, but we will prune it if we have to later to fit
                         # into PRUNE_MAX_COUNT
-                        prunable_stamps[device_address] = device.last_seen
+                        prunable_stamps[device_address] = last_seen
 
-                elif device.last_seen < MONOTONIC_TIME() - PRUNE_TIME_DEFAULT:
+                elif last_seen < stale_stamp:
                     # It's a static address, and stale.
-                    _LOGGER.debug(
-                        "Marking old device entry for pruning: %s",
-                        device.name or device_address,
-                    )
-                    prune_list.append(device_address)
+                    if debug_enabled:
+                        _LOGGER.debug(
+                            "Marking old device entry for pruning: %s",
+                            device.name or device_address,
+                        )
+                    prune_append(device_address)
                 else:
                     # Device is static, not so old, but we might have to prune it anyway
-                    prunable_stamps[device_address] = device.last_seen
+                    prunable_stamps[device_address] = last_seen
 
         prune_quota = len(self.devices) - len(prune_list) - PRUNE_MAX_COUNT
         if prune_quota > 0:
             # We need to find more addresses to prune. Perhaps we live
             # in a busy train station, or are under some sort of BLE-MAC
             # DOS-attack.
-            sorted_addresses = sorted([(v, k) for k, v in prunable_stamps.items()])
             _LOGGER.info("Having to prune %s extra devices to make quota.", prune_quota)
-            # pylint: disable-next=unused-variable
-            for _stamp, address in sorted_addresses[:prune_quota]:
-                prune_list.append(address)
+            # We only want the oldest few, so no need to sort the lot.
+            prune_list.extend(heapq.nsmallest(prune_quota, prunable_stamps, key=prunable_stamps.get))
 
         # Perform any pruning we found to do
         for device_address in prune_list:
-            _LOGGER.debug("Acting on prune list for %s", device_address)
-            del self.devices[device_address]
+            if debug_enabled:
+                _LOGGER.debug("Acting on prune list for %s", device_address)
+            if self.devices.pop(device_address).is_metadevice:
+                # Don't leave a stale copy for update_metadevices. If the beacon
+                # turns up again it'll be re-created and registered afresh.
+                self.metadevices.pop(device_address, None)
 
     def discover_private_ble_metadevices(self):
         """
@@ -859,6 +1031,7 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
                         # Add metadevice to list so it gets included in update_metadevices
                         if metadevice.address not in self.metadevices:
                             self.metadevices[metadevice.address] = metadevice
+                            metadevice.is_metadevice = True
 
                         if pb_source_address is not None:
                             # We've got a source MAC address!
@@ -908,6 +1081,7 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
                 # (do one-off init stuff here)
                 if metadevice.address not in self.metadevices:
                     self.metadevices[metadevice.address] = metadevice
+                    metadevice.is_metadevice = True
                 else:
                     _LOGGER.warning(
                         "Metadevice already tracked despite not existing yet. %s",
@@ -925,7 +1099,7 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
                     setattr(metadevice, attribute, getattr(source_device, attribute, None))
 
                 # Check if we should set up sensors for this beacon
-                if metadevice.address.upper() in self.options.get(CONF_DEVICES, []):
+                if metadevice.is_configured:
                     # This is a meta-device we track. Flag it for set-up:
                     metadevice.create_sensor = True
 
@@ -958,106 +1132,72 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         # iBeacon devices should already have their metadevices created.
         # FIXME: irk and ibeacons will fight over their relative ref_power too.
 
+        get_device = self._get_device
         for metadev in self.metadevices.values():
             # We Expect the first beacon source to be the current one.
             # This is maintained by ibeacon or private_ble metadevice creation/update
-            latest_source: str | None = None
-            source_device: BermudaDevice | None = None
-            if len(metadev.beacon_sources) > 0:
-                latest_source = metadev.beacon_sources[0]
-                if latest_source is not None:
-                    source_device = self._get_device(latest_source)
-
-            if latest_source is not None and source_device is not None:
-                # Map the source device's scanner list into ours
-                metadev.scanners = source_device.scanners
-
-                # Set the source device's ref_power from our own. This will cause
-                # the source device and all its scanner entries to update their
-                # distance measurements. This won't affect Area wins though, because
-                # they are "relative", not absolute.
-
-                # FIXME: This has two potential bugs:
-                # - if multiple metadevices share a source, they will
-                #   "fight" over their preferred ref_power, if different.
-                # - The non-meta device (if tracked) will receive distances
-                #   based on the meta device's ref_power.
-                # - The non-meta device if tracked will have its own ref_power ignored.
-                #
-                # None of these are terribly awful, but worth fixing.
-
-                # Note we are setting the ref_power on the source_device, not the
-                # individual scanner entries (it will propagate to them though)
-                if source_device.ref_power != metadev.ref_power:
-                    source_device.set_ref_power(metadev.ref_power)
-
-                # anything that isn't already set to something interesting, overwrite
-                # it with the new device's data.
-                # Defaults:
-                for attribute in [
-                    # "create_sensor",  # don't copy this, maybe we're tracking the device alone
-                    "local_name",  # names we copy if there isn't one already.
-                    "manufacturer",
-                    "name",
-                    # "options",
-                    "prefname",
-                ]:
-                    if hasattr(metadev, attribute):
-                        if getattr(metadev, attribute) in [None, False]:
-                            setattr(metadev, attribute, getattr(source_device, attribute))
-                    else:
-                        _LOGGER.error(
-                            "Devices don't have a '%s' attribute, this is a bug.",
-                            attribute,
-                        )
-                # Anything that's VERY interesting, overwrite it regardless of what's already there:
-                # INTERESTING:
-                for attribute in [
-                    "area_distance",
-                    "area_id",
-                    "area_name",
-                    "area_rssi",
-                    "area_scanner",
-                    "beacon_major",
-                    "beacon_minor",
-                    "beacon_power",
-                    "beacon_unique_id",
-                    "beacon_uuid",
-                    "connectable",
-                    "zone",
-                ]:
-                    if hasattr(metadev, attribute):
-                        setattr(metadev, attribute, getattr(source_device, attribute))
-                    else:
-                        _LOGGER.error(
-                            "Devices don't have a '%s' attribute, this is a bug.",
-                            attribute,
-                        )
+            if not metadev.beacon_sources:
+                # No sources yet, nothing to copy from.
+                continue
+            latest_source = metadev.beacon_sources[0]
+            if latest_source is None or (source_device := get_device(latest_source)) is None:
+                continue
 
-                if source_device.last_seen > metadev.last_seen:
-                    # Source is newer than the latest recorded, update last_seen
-                    metadev.last_seen = source_device.last_seen
+            # Map the source device's scanner list into ours
+            metadev.scanners = source_device.scanners
 
-                elif source_device.last_seen == 0:
-                    # _LOGGER.debug(
-                    #     "New source %s for %s has no stamp yet. This is"
-                    #     " expected if it's a fresh Private BLE source.",
-                    #     source_device.address,
-                    #     metadev.name
-                    # )
-                    pass
-                elif source_device.last_seen < metadev.last_seen:
-                    # We should not have a source device that is older than the
-                    # current metadevice, so flag this if it occurs.
-                    # This caught bug #138, not that I realised it at the time!
-                    # (https://github.com/agittins/bermuda/issues/138)
-                    _LOGGER.debug(
-                        "Using freshest advert from %s for %s but it's still %s seconds too old!",
-                        source_device.address,
-                        metadev.name,
-                        metadev.last_seen - source_device.last_seen,
-                    )
-                # else the stamps are equal, which is perfectly OK.
+            # Set the source device's ref_power from our own. This will cause
+            # the source device and all its scanner entries to update their
+            # distance measurements. This won't affect Area wins though, because
+            # they are "relative", not absolute.
+
+            # FIXME: This has two potential bugs:
+            # - if multiple metadevices share a source, they will
+            #   "fight" over their preferred ref_power, if different.
+            # - The non-meta device (if tracked) will receive distances
+            #   based on the meta device's ref_power.
+            # - The non-meta device if tracked will have its own ref_power ignored.
+            #
+            # None of these are terribly awful, but worth fixing.
+
+            # Note we are setting the ref_power on the source_device, not the
+            # individual scanner entries (it will propagate to them though)
+            if source_device.ref_power != metadev.ref_power:
+                source_device.set_ref_power(metadev.ref_power)
+
+            # anything that isn't already set to something interesting, overwrite
+            # it with the new device's data.
+            for attribute in METADEVICE_DEFAULT_ATTRS:
+                if getattr(metadev, attribute) in (None, False):
+                    setattr(metadev, attribute, getattr(source_device, attribute))
+            # Anything that's VERY interesting, overwrite it regardless of what's already there:
+            for attribute in METADEVICE_INTERESTING_ATTRS:
+                setattr(metadev, attribute, getattr(source_device, attribute))
+
+            if source_device.last_seen > metadev.last_seen:
+                # Source is newer than the latest recorded, update last_seen
+                metadev.last_seen = source_device.last_seen
+
+            elif source_device.last_seen == 0:
+                # _LOGGER.debug(
+                #     "New source %s for %s has no stamp yet. This is"
+                #     " expected if it's a fresh Private BLE source.",
+                #     source_device.address,
+                #     metadev.name
+                # )
+                pass
+            elif source_device.last_seen < metadev.last_seen:
+                # We should not have a source device that is older than the
+                # current metadevice, so flag this if it occurs.
+                # This caught bug #138, not that I realised it at the time!
+                # (https://github.com/agittins/bermuda/issues/138)
+                _LOGGER.debug(
+                    "Using freshest advert from %s for %s but it's still %s seconds too old!",
+                    source_device.address,
+                    metadev.name,
+                    metadev.last_seen - source_device.last_seen,
+                )
+            # else the stamps are equal, which is perfectly OK.
 
     def dt_mono_to_datetime(self, stamp) -> datetime:
         """Given a monotonic timestamp, convert to datetime object."""
@@ -1082,45 +1222,57 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
 
     def _refresh_areas_by_min_distance(self):
         """Set area for ALL devices based on closest beacon."""
+        # Options don't change between reloads, so look the radius up once per
+        # cycle rather than once per device.
+        max_radius = self.options.get(CONF_MAX_RADIUS, DEFAULT_MAX_RADIUS)
         for device in self.devices.values():
             if device.is_scanner is not True:
-                self._refresh_area_by_min_distance(device)
+                self._refresh_area_by_min_distance(device, max_radius)
 
-    def _refresh_area_by_min_distance(self, device: BermudaDevice):
+    def _refresh_area_by_min_distance(self, device: BermudaDevice, max_radius: float):
         """Very basic Area setting by finding closest beacon to a given device."""
-        closest_scanner: BermudaDeviceScanner | None = None
-        for scanner in device.scanners.values():
-            # Check each scanner and keep note of the closest one based on rssi_distance.
-            # Note that rssi_distance is smoothed/filtered, and might be None if the last
-            # reading was old enough that our algo decides it's "away".
-            if scanner.rssi_distance is not None and scanner.rssi_distance < self.options.get(
-                CONF_MAX_RADIUS, DEFAULT_MAX_RADIUS
-            ):
-                # It's inside max_radius...
-                if closest_scanner is None:
-                    # no encumbent, we win!
-                    closest_scanner = scanner
-                elif closest_scanner.rssi_distance is None or scanner.rssi_distance < closest_scanner.rssi_distance:
-                    # We're closer than the last-closest, we win!
-                    closest_scanner = scanner
+        # Only scanners with a current reading inside max_radius are candidates.
+        # Note that rssi_distance is smoothed/filtered, and might be None if the last
+        # reading was old enough that our algo decides it's "away".
+        # min() keeps the first of any equal distances, same as a strict "<" loop.
+        closest_scanner: BermudaDeviceScanner | None = min(
+            (
+                scanner
+                for scanner in device.scanners.values()
+                if scanner.rssi_distance is not None and scanner.rssi_distance < max_radius
+            ),
+            key=_rssi_distance_key,
+            default=None,
+        )
 
         # Apply the newly-found closest scanner (or apply None if we didn't find one)
         device.apply_scanner_selection(closest_scanner)
 
+    def _ha_scanners_changed(self) -> bool:
+        """
+        Check if HA's bluetooth backend has gained or lost scanners.
+
+        Cheap compared to _refresh_scanners, since it's just a set comparison
+        against the scanners we saw on our last refresh. Changes to scanners'
+        device registry entries are caught by handle_devreg_changes instead.
+        """
+        return (
+            self._manager._connectable_scanners | self._manager._non_connectable_scanners  # noqa: SLF001
+        ) != self._hascanners
+
     def _refresh_scanners(self, scanners: list[BluetoothScannerDevice] | None = None):
         """
         Refresh our local (and saved) list of scanners (BLE Proxies).
 
         The scanners list param is ignored and no longer required. We refresh all scanners
         each time we are called, since the overhead is now lower and we had prematurely
-        optimised the routine. We only save out the config entry if it has changed *AND*
-        we haven't tried to do so in the last SAVEOUT_COOLDOWN seconds (10 seems to be enough,
-        we only do it when the proxies config has *actually* changed).
+        optimised the routine. We only save out the config entry if it has changed, and
+        then only after a SAVEOUT_COOLDOWN seconds debounce (10 seems to be enough, we
+        only do it when the proxies config has *actually* changed).
         """
-        _previous_scannerlist = [device.address for device in self.devices.values() if device.is_scanner]
-        _purge_scanners = _previous_scannerlist.copy()
+        _purge_scanners = set(self._scanners)
 
-        # _LOGGER.error("Preserving %d current scanner entries", len(_previous_scannerlist))
+        # _LOGGER.error("Preserving %d current scanner entries", len(_purge_scanners))
 
         # Find active HaBaseScanners in the backend, and only pay attention to those
         # instead of trawling through the device registry first.
@@ -1131,14 +1283,11 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         #
         # Evil: We're acessing private members of bt manager to do it since there's no API call for it.
         self._hascanners = self._manager._connectable_scanners | self._manager._non_connectable_scanners  # noqa: SLF001
+        async_get_device = self._device_registry.async_get_device
+        get_or_create_device = self._get_or_create_device
         for hascanner in self._hascanners:
-            scanner_address = format_mac(hascanner.source).lower()
-            scanner_devreg = self._device_registry.async_get_device(
-                connections={
-                    ("mac", scanner_address),  # Matches ESPHome proxies, Shellys etc
-                    ("bluetooth", scanner_address.upper()),  # Matches local USB Bluetooth (hci0..)
-                }
-            )
+            scanner_address = mac_norm(hascanner.source)
+            scanner_devreg = async_get_device(connections=scanner_devreg_connections(scanner_address))
             if scanner_devreg is None:
                 _LOGGER_SPAM_LESS.error(
                     "scanner_not_in_devreg",
@@ -1149,18 +1298,14 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
                 continue
             # _LOGGER.info("Great! Found scanner: %s (%s)", scanner_ha.name, scanner_ha.source)
             # Since this scanner still exists, we won't purge it
-            if scanner_address in _purge_scanners:
-                _purge_scanners.remove(scanner_address)
+            _purge_scanners.discard(scanner_address)
 
             # Populate the local copy of timestamps, if applicable
             if isinstance(hascanner, BaseHaRemoteScanner):
                 self._hascanner_timestamps[hascanner.source.lower()] = hascanner._discovered_device_timestamps  # noqa: SLF001
 
-            scanner_b = self._get_device(scanner_address)
-            if scanner_b is None:
-                # It's a new scanner, we will need to update our saved config.
-                # _LOGGER.debug("New Scanner: %s", scanner_ha.name)
-                scanner_b = self._get_or_create_device(scanner_address)
+            # If it's a new scanner this creates it, and we will need to update our saved config.
+            scanner_b = get_or_create_device(scanner_address)
 
             # We found the device entry and have created our scannerdevice,
             # now update any fields that might be new from the device reg:
@@ -1170,21 +1315,30 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
                 scanner_b.name = scanner_devreg.name_by_user
             else:
                 scanner_b.name = scanner_devreg.name
-            areas = self.area_reg.async_get_area(scanner_devreg.area_id) if scanner_devreg.area_id else None
-            if areas is not None and hasattr(areas, "name"):
-                scanner_b.area_name = areas.name
+            area_id = scanner_devreg.area_id
+            if area_id in self._area_name_cache:
+                area_name = self._area_name_cache[area_id]
+            else:
+                areas = self.area_reg.async_get_area(area_id) if area_id else None
+                area_name = getattr(areas, "name", None)
+                if area_id:
+                    self._area_name_cache[area_id] = area_name
+            if area_name is not None:
+                scanner_b.area_name = area_name
             else:
                 _LOGGER_SPAM_LESS.warning(
                     f"no_area_on_update{scanner_b.name}",
                     "No area name or no area id updating scanner %s, area_id %s",
                     scanner_b.name,
-                    areas,
+                    area_id,
                 )
             scanner_b.is_scanner = True
+            self._scanners[scanner_b.address] = scanner_b
 
         # Now un-tag any devices that are no longer scanners
         for address in _purge_scanners:
-            self.devices[address].is_scanner = False
+            self._scanners.pop(address).is_scanner = False
+            self._confdata_scanner_dicts.pop(address, None)
             update_scannerlist = True
 
         # Because of the quick check-time and the checks we have on saving the config_entry,
@@ -1197,56 +1351,74 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
                 self._do_full_scanner_init = True
                 return False
 
-            # Build the config_data and self.scanner_list structs fresh
-            # ready to update our config entry if needed.
+            # Rebuild self.scanner_list and take a flat snapshot of the fields
+            # we save, which is much cheaper to compare than the nested dicts.
             self.scanner_list.clear()
+            self.scanner_list.extend(sorted(self._scanners))
+            snapshot = tuple(
+                (address, tuple(getattr(self._scanners[address], key) for key in CONFDATA_SCANNER_KEYS))
+                for address in self.scanner_list
+            )
+            if snapshot == self._confdata_scanners_snapshot:
+                # Nothing has changed since we last matched the saved config.
+                # Drop any save-out parked for a change that has since reverted.
+                self._async_cancel_saveout()
+                self._do_full_scanner_init = False
+                return True
+
+            # Build the config_data struct ready to update our config entry if needed,
+            # re-using the dicts for any scanners whose fields haven't changed.
             confdata_scanners: dict[str, dict] = {}
-            for device in self.devices.values():
-                if device.is_scanner:
-                    self.scanner_list.append(device.address)
+            for address, values in snapshot:
+                cached = self._confdata_scanner_dicts.get(address)
+                if cached is None or cached[0] != values:
                     # Only add the necessary fields to confdata
-                    confdata_scanners[device.address] = {
-                        key: getattr(device, key)
-                        for key in [
-                            "name",
-                            "local_name",
-                            "prefname",
-                            "address",
-                            "ref_power",
-                            "unique_id",
-                            "address_type",
-                            "area_id",
-                            "area_name",
-                            "is_scanner",
-                            "entry_id",
-                        ]
-                    }
+                    cached = (values, dict(zip(CONFDATA_SCANNER_KEYS, values, strict=True)))
+                    self._confdata_scanner_dicts[address] = cached
+                confdata_scanners[address] = cached[1]
 
             if self.config_entry.data.get(CONFDATA_SCANNERS, {}) == confdata_scanners:
                 # **** BAIL OUT, CONFIG HAS NOT CHANGED ****
                 # _LOGGER.debug("Scanner configs are identical, not doing update.")
+                self._async_cancel_saveout()
+                self._confdata_scanners_snapshot = snapshot
                 self._do_full_scanner_init = False
                 return True
 
             # We will arrive here every second for as long as the saved config is
             # different from our running config. But we don't want to save immediately,
-            # since there is a lot of bouncing that happens during setup.
-
-            # Make sure we haven't requested recently...
-            if self.last_config_entry_update_request < MONOTONIC_TIME() - SAVEOUT_COOLDOWN:
-                # OK, we're good to go.
-                self.last_config_entry_update_request = MONOTONIC_TIME()
+            # since there is a lot of bouncing that happens during setup. So just
+            # park the latest version and let the timer save it out.
+            self._pending_confdata_scanners = confdata_scanners
+            if self._saveout_cancel is None:
                 _LOGGER.debug("Requesting save-out of scanner configs")
-                self.hass.add_job(self.async_call_update_entry, confdata_scanners)
+                self._saveout_cancel = async_call_later(self.hass, SAVEOUT_COOLDOWN, self._async_flush_saveout)
 
         return True
 
+    @callback
+    def _async_flush_saveout(self, _now) -> None:
+        """Save out the most recent pending scanner config, once the cooldown expires."""
+        self._saveout_cancel = None
+        confdata_scanners = self._pending_confdata_scanners
+        self._pending_confdata_scanners = None
+        if confdata_scanners is not None:
+            self.async_call_update_entry(confdata_scanners)
+
+    @callback
+    def _async_cancel_saveout(self) -> None:
+        """Cancel any pending save-out, eg when we are unloaded."""
+        if self._saveout_cancel is not None:
+            self._saveout_cancel()
+            self._saveout_cancel = None
+        self._pending_confdata_scanners = None
+
     @callback
     def async_call_update_entry(self, confdata_scanners) -> None:
         """
         Call in the event loop to update the scanner entries in our config.
 
-        We do this via add_job to ensure it runs in the event loop.
+        This is called from the save-out timer, which runs in the event loop.
         """
         # Clear the flag for init and update the stamp
         self._do_full_scanner_init = False
@@ -1279,12 +1451,13 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
             # known IRK/Private BLE Devices
             addresses += self.pb_state_sources
 
-        # lowercase all the addresses for matching
-        addresses = list(map(str.lower, addresses))
+        # lowercase all the addresses for matching, as a set so each
+        # device check is a single lookup.
+        addresses_set = frozenset(map(str.lower, addresses))
 
         # Build the dict of devices
         for address, device in self.devices.items():
-            if len(addresses) == 0 or address.lower() in addresses:
+            if not addresses_set or address.lower() in addresses_set:
                 out[address] = device.to_dict()
 
         if redact:
@@ -1305,48 +1478,87 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         addresses.
         """
         i = len(self.redactions)  # not entirely accurate but we don't care.
+        # New pairs are gathered here and merged in with one update() at the end.
+        # Lookups check both, so an address is only numbered once per call.
+        redactions = self.redactions
+        new_redactions: dict[str, str] = {}
 
         # SCANNERS
         for non_lower_address in self.scanner_list:
             address = non_lower_address.lower()
-            if address not in self.redactions:
+            if address not in redactions and address not in new_redactions:
                 i += 1
-                self.redactions[address] = f"{address[:2]}::SCANNER_{i}::{address[-2:]}"
+                new_redactions[address] = f"{address[:2]}::SCANNER_{i}::{address[-2:]}"
         # CONFIGURED DEVICES
         for non_lower_address in self.options.get(CONF_DEVICES, []):
             address = non_lower_address.lower()
-            if address not in self.redactions:
+            if address not in redactions and address not in new_redactions:
                 i += 1
                 if address.count("_") == 2:
-                    self.redactions[address] = f"{address[:4]}::CFG_iBea_{i}::{address[32:]}"
+                    new_redactions[address] = f"{address[:4]}::CFG_iBea_{i}::{address[32:]}"
                     # Raw uuid in advert
-                    self.redactions[address.split("_")[0]] = f"{address[:4]}::CFG_iBea_{i}_{address[32:]}::"
+                    new_redactions[address.split("_")[0]] = f"{address[:4]}::CFG_iBea_{i}_{address[32:]}::"
                 elif len(address) == 17:
-                    self.redactions[address] = f"{address[:2]}::CFG_MAC_{i}::{address[-2:]}"
+                    new_redactions[address] = f"{address[:2]}::CFG_MAC_{i}::{address[-2:]}"
                 else:
                     # Don't know what it is, but not a mac.
-                    self.redactions[address] = f"CFG_OTHER_{1}_{address}"
+                    new_redactions[address] = f"CFG_OTHER_{1}_{address}"
         # EVERYTHING ELSE
         for non_lower_address, device in self.devices.items():
             address = non_lower_address.lower()
-            if address not in self.redactions:
+            if address not in redactions and address not in new_redactions:
                 # Only add if they are not already there.
                 i += 1
                 if device.address_type == ADDR_TYPE_PRIVATE_BLE_DEVICE:
-                    self.redactions[address] = f"{address[:4]}::IRK_DEV_{i}"
+                    new_redactions[address] = f"{address[:4]}::IRK_DEV_{i}"
                 elif address.count("_") == 2:
-                    self.redactions[address] = f"{address[:4]}::OTHER_iBea_{i}::{address[32:]}"
+                    new_redactions[address] = f"{address[:4]}::OTHER_iBea_{i}::{address[32:]}"
                     # Raw uuid in advert
-                    self.redactions[address.split("_")[0]] = f"{address[:4]}::OTHER_iBea_{i}_{address[32:]}::"
+                    new_redactions[address.split("_")[0]] = f"{address[:4]}::OTHER_iBea_{i}_{address[32:]}::"
                 elif len(address) == 17:  # a MAC
-                    self.redactions[address] = f"{address[:2]}::OTHER_MAC_{i}::{address[-2:]}"
+                    new_redactions[address] = f"{address[:2]}::OTHER_MAC_{i}::{address[-2:]}"
                 else:
                     # Don't know what it is.
-                    self.redactions[address] = f"OTHER_{1}_{address}"
+                    new_redactions[address] = f"OTHER_{1}_{address}"
+
+        redactions.update(new_redactions)
+
+        # Redactions only ever grow (until purged), so a change in size is
+        # enough to tell us the pattern needs rebuilding.
+        if self._redact_count != len(self.redactions):
+            self._redact_count = len(self.redactions)
+            self._redact_cache = {}
+            self._redact_cache_hits = Counter()
+            if self.redactions:
+                # A MAC address is 17 chars, but some keys may be shorter.
+                self._redact_min_len = min(17, *map(len, self.redactions))
+                # Longest first, so that a full address wins over any shorter key
+                # (like a raw iBeacon uuid) that happens to be a prefix of it. Known
+                # keys also go before the generic pattern so they win over it.
+                known = "|".join(map(re.escape, sorted(self.redactions, key=len, reverse=True)))
+                self._redact_re = re.compile(f"(?P<known>{known})|{self._redact_generic_re.pattern}")
+                self._redact_re_sub = self._redact_re.sub
+            else:
+                self._redact_min_len = 17
+                self._redact_re = self._redact_generic_re
+                self._redact_re_sub = self._redact_re.sub
+
+    def _redact_sub(self, match: re.Match) -> str:
+        """Return the replacement for a matched redaction key or generic MAC address."""
+        if match.lastgroup == "known":
+            return self.redactions[match.group(0)]
+        # Keeps the first and last octets, eg "aa:xx:xx:xx:xx:ff"
+        return f"{match['start']}:xx:xx:xx:xx:{match['end']}"
 
     async def purge_redactions(self, hass: HomeAssistant):
         """Empty redactions and free up some memory."""
         self.redactions = {}
+        self._redact_re = self._redact_generic_re
+        self._redact_re_sub = self._redact_re.sub
+        self._redact_count = 0
+        self._redact_min_len = 17
+        self._redact_cache = {}
+        self._redact_cache_hits = Counter()
         self._purge_task = async_call_later(
             hass,
             8 * 60 * 60,
@@ -1372,32 +1584,107 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         Wash any collection of data of any MAC addresses.
 
         Uses the redaction list of substitutions if already created, then
-        washes any remaining mac-like addresses. This routine is recursive,
-        so if you're changing it bear that in mind!
+        washes any remaining mac-like addresses. Nested dicts and lists are
+        walked with a work stack rather than recursion, so deep structures
+        can't hit the recursion limit. Returns new containers, the input is
+        left untouched.
         """
         if first_run:
             # On first/outer call, refresh the redaction list to ensure
             # we don't let any new addresses slip through. Might be expensive
             # on first call, but will be much cheaper for subsequent calls.
             self.redaction_list_update()
-            first_run = False
+        if type(data) in REDACT_PASSTHROUGH_TYPES:
+            return data
         if isinstance(data, str):
-            data = data.lower()
-            # the end of the recursive wormhole, do the actual work:
-            if data not in self.redactions:
-                for find, fix in list(self.redactions.items()):
-                    if find in data:
-                        self.redactions[data] = data.replace(find, fix)
-                        data = self.redactions[data]
-                        break
-            else:
-                data = self.redactions[data]
-            # redactions done, now replace any remaining MAC addresses
-            # We are only looking for xx:xx:xx... format.
-            return self._redact_generic_re.sub(self._redact_generic_sub, data)
-        elif isinstance(data, dict):
-            return {self.redact_data(k, False): self.redact_data(v, False) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [self.redact_data(v, False) for v in data]
-        else:
+            return self._redact_string(data)
+        if not isinstance(data, dict | list):
             return data
+
+        # Each stack entry is a source container and the (empty) output container
+        # that its washed contents go into. Child containers are created and placed
+        # in their parent immediately, so ordering is preserved even though their
+        # contents get filled in later.
+        out: dict | list = {} if isinstance(data, dict) else []
+        stack: list[tuple[dict | list, dict | list]] = [(data, out)]
+        # Bound once, since these get used for every node in the payload.
+        redact_string = self._redact_string
+        push = stack.append
+        pop = stack.pop
+        min_len = self._redact_min_len
+        while stack:
+            source, dest = pop()
+            # dest is always one of our own plain containers, so its type
+            # tells us how to walk source as well.
+            dest_is_dict = type(dest) is dict
+            items = source.items() if dest_is_dict else enumerate(source)
+            for key, value in items:
+                # Exact type checks are cheaper than isinstance, and cover nearly
+                # everything we see. Subclasses fall through to the isinstance
+                # checks and come out as the plain types.
+                value_type = type(value)
+                if value_type is str:
+                    value = redact_string(value)  # noqa: PLW2901
+                elif value_type is dict or value_type is list:
+                    child = {} if value_type is dict else []
+                    push((value, child))
+                    value = child  # noqa: PLW2901
+                elif value_type in REDACT_PASSTHROUGH_TYPES:
+                    pass
+                elif isinstance(value, str):
+                    value = redact_string(value)  # noqa: PLW2901
+                elif isinstance(value, dict | list):
+                    child = {} if isinstance(value, dict) else []
+                    push((value, child))
+                    value = child  # noqa: PLW2901
+                if dest_is_dict:
+                    # Keys are mostly short lowercase identifiers, which washing
+                    # would return unchanged. Only the rest need the full treatment.
+                    if isinstance(key, str) and (len(key) >= min_len or not key.islower()):
+                        key = redact_string(key)  # noqa: PLW2901
+                    dest[key] = value
+                else:
+                    dest.append(value)
+        return out
+
+    def _redact_string(self, data: str) -> str:
+        """Wash a single string of any MAC addresses."""
+        # The same strings turn up many times in a dump, so check if
+        # we've already done this one.
+        cache = self._redact_cache
+        cached = cache.get(data)
+        if cached is not None:
+            self._redact_cache_hits[data] += 1
+            return cached
+        original = data
+        # Strings that are exactly a known address are common (address fields),
+        # and our keys are already lowercase so there's no need to lower() first.
+        fix = self.redactions.get(data)
+        if fix is None:
+            if not data.islower():
+                # Saves a copy for the (common) already-lowercase strings.
+                data = data.lower()
+                fix = self.redactions.get(data)
+        if fix is not None:
+            data = fix
+        elif len(data) >= self._redact_min_len:
+            # Known redactions and any remaining MAC addresses (only looking for
+            # xx:xx:xx... format) are replaced in the same pass.
+            data = self._redact_re_sub(self._redact_sub, data)
+        cache[original] = data
+        self._redact_cache_hits[original] = 1
+        if len(cache) > REDACT_CACHE_MAX:
+            self._redact_cache_evict()
+        return data
+
+    def _redact_cache_evict(self):
+        """
+        Drop the least-used half of the redaction cache.
+
+        Evicting in bulk keeps this off the per-string path. The survivors have
+        their counts halved, so strings that were only popular a while ago can
+        eventually make way for new ones.
+        """
+        keep = self._redact_cache_hits.most_common(REDACT_CACHE_MAX // 2)
+        self._redact_cache = {key: self._redact_cache[key] for key, _count in keep}
+        self._redact_cache_hits = Counter({key: count // 2 + 1 for key, count in keep})
@@ -33,29 +33,31 @@ async def async_setup_entry(
     created_devices = []  # list of devices we've already created entities for
 
     @callback
-    def device_new(address: str, scanners: list[str]) -> None:  # pylint: disable=unused-argument
+    def device_new(addresses: list[str], scanners: list[str]) -> None:  # pylint: disable=unused-argument
         """
-        Create entities for newly-found device.
+        Create entities for newly-found devices.
 
-        Called from the data co-ordinator when it finds a new device that needs
+        Called from the data co-ordinator when it finds new devices that need
         to have sensors created. Not called directly, but via the dispatch
         facility from HA.
         Make sure you have a full list of scanners ready before calling this.
         """
-        if address not in created_devices:
-            entities = []
-            entities.append(BermudaDeviceTracker(coordinator, entry, address))
+        entities = []
+        for address in addresses:
+            if address not in created_devices:
+                entities.append(BermudaDeviceTracker(coordinator, entry, address))
+                created_devices.append(address)
+            # else:
+            #     _LOGGER.debug(
+            #         "Ignoring create request for existing dev_tracker %s", address
+            #     )
+        if entities:
             # We set update before add to False because we are being
             # call(back(ed)) from the update, so causing it to call another would be... bad.
             async_add_devices(entities, False)
-            created_devices.append(address)
-        else:
-            # _LOGGER.debug(
-            #     "Ignoring create request for existing dev_tracker %s", address
-            # )
-            pass
         # tell the co-ord we've done it.
-        coordinator.device_tracker_created(address)
+        for address in addresses:
+            coordinator.device_tracker_created(address)
 
     # Connect device_new to a signal so the coordinator can call it
     entry.async_on_unload(async_dispatcher_connect(hass, SIGNAL_DEVICE_NEW, device_new))
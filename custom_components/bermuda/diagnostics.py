@@ -29,6 +29,7 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: Bermuda
         "active_devices": f"{coordinator.count_active_devices()}/{len(coordinator.devices)}",
         "active_scanners": f"{coordinator.count_active_scanners()}/{len(coordinator.scanner_list)}",
         "devices": await coordinator.service_dump_devices(call),
+        # Not thread-safe to do in the executor: bt_diags holds live manager dicts.
         "bt_manager": coordinator.redact_data(bt_diags),
     }
     return data
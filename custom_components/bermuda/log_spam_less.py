@@ -2,13 +2,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import logging
 
 from homeassistant.components.bluetooth import MONOTONIC_TIME
 
-if TYPE_CHECKING:
-    import logging
-
 
 class BermudaLogSpamLess:
     """
@@ -34,14 +31,15 @@ class BermudaLogSpamLess:
         but if the message should be logged it returns the number of attempted uses
         since last time it was sent - which might be zero.
         """
+        nowstamp = MONOTONIC_TIME()
         if key in self._keycache:
             # key exists, check timestamps
             cache = self._keycache[key]
-            if cache["stamp"] < MONOTONIC_TIME() - self._interval:
+            if cache["stamp"] < nowstamp - self._interval:
                 # It's time to emit the message
                 count = cache["count"]
                 cache["count"] = 0
-                cache["stamp"] = MONOTONIC_TIME()
+                cache["stamp"] = nowstamp
                 return count
             # We sent this message recently, don't spam
             cache["count"] += 1
@@ -49,7 +47,7 @@ class BermudaLogSpamLess:
         else:
             # Key is completely new, store the new stamp and let it through
             self._keycache[key] = {
-                "stamp": MONOTONIC_TIME(),
+                "stamp": nowstamp,
                 "count": 0,
             }
             return 0
@@ -69,24 +67,32 @@ class BermudaLogSpamLess:
 
     def debug(self, key, msg, *args, **kwargs):
         """Send log message, if no log was issued with the same key recently."""
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
         newmsg = self._prep_message(key, msg)
         if newmsg is not None:
             self._logger.debug(newmsg, *args, **kwargs)
 
     def info(self, key, msg, *args, **kwargs):
         """Send log message, if no log was issued with the same key recently."""
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
         newmsg = self._prep_message(key, msg)
         if newmsg is not None:
             self._logger.info(newmsg, *args, **kwargs)
 
     def warning(self, key, msg, *args, **kwargs):
         """Send log message, if no log was issued with the same key recently."""
+        if not self._logger.isEnabledFor(logging.WARNING):
+            return
         newmsg = self._prep_message(key, msg)
         if newmsg is not None:
             self._logger.warning(newmsg, *args, **kwargs)
 
     def error(self, key, msg, *args, **kwargs):
         """Send log message, if no log was issued with the same key recently."""
+        if not self._logger.isEnabledFor(logging.ERROR):
+            return
         newmsg = self._prep_message(key, msg)
         if newmsg is not None:
             self._logger.error(newmsg, *args, **kwargs)
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from functools import lru_cache
 
+from homeassistant.helpers.device_registry import format_mac
+
 
 @lru_cache(1024)
 def rssi_to_metres(rssi, ref_power=None, attenuation=None):
@@ -44,3 +46,33 @@ def clean_charbuf(instring: str | None) -> str:
     if instring is not None:
         return instring.strip(" \t\r\n\x00").split("\0")[0]
     return ""
+
+
+@lru_cache(64)
+def scanner_devreg_connections(scanner_address: str) -> frozenset[tuple[str, str]]:
+    """
+    Return the device registry connections that may identify a scanner.
+
+    Expects a lower-cased, colon-separated mac address. ESPHome proxies,
+    Shellys etc are registered by their "mac", while local USB Bluetooth
+    adaptors (hci0..) use an upper-cased "bluetooth" address. Scanner
+    addresses don't change, so the set is only built once per scanner.
+    """
+    return frozenset(
+        (
+            ("mac", scanner_address),
+            ("bluetooth", scanner_address.upper()),
+        )
+    )
+
+
+@lru_cache(2048)
+def mac_norm(address: str) -> str:
+    """
+    Return the address as a lower-cased, colon-separated mac address.
+
+    Anything format_mac doesn't recognise as a mac (IRKs, iBeacon uuids etc)
+    is just lower-cased. We see the same few hundred addresses over and over,
+    so the results are cached.
+    """
+    return format_mac(address).lower()
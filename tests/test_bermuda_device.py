@@ -0,0 +1,119 @@
+"""Test Bermuda BLE Trilateration devices going idle and waking up."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from homeassistant.components.bluetooth import MONOTONIC_TIME
+from homeassistant.const import STATE_NOT_HOME
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.bermuda.bermuda_device_scanner import BermudaDeviceScanner
+
+DEVICE_ADDRESS = "11:22:33:44:55:66"
+SCANNER_ADDRESS = "aa:bb:cc:dd:ee:ff"
+
+
+def _scandata(rssi: int) -> SimpleNamespace:
+    """Fake up the parts of a BluetoothScannerDevice that update_scanner reads."""
+    return SimpleNamespace(
+        scanner=SimpleNamespace(name="Test Proxy", adapter="hci0", source=SCANNER_ADDRESS.upper()),
+        advertisement=SimpleNamespace(rssi=rssi, tx_power=None),
+    )
+
+
+def _setup_device(coordinator, address=DEVICE_ADDRESS):
+    """Return a device that has had one advert from our scanner."""
+    scanner = coordinator._get_or_create_device(SCANNER_ADDRESS)
+    scanner.name = "Test Proxy"
+    device = coordinator._get_or_create_device(address)
+    device.update_scanner(scanner, _scandata(-60))
+    return device, scanner
+
+
+def _go_idle(device) -> float:
+    """Run calculate_data far enough in the future for every scanner to time out."""
+    nowstamp = MONOTONIC_TIME() + 100000
+    device.calculate_data(nowstamp)  # Takes in the arrival reading
+    device.calculate_data(nowstamp)  # Now stale, so away and not_home
+    assert device.zone == STATE_NOT_HOME
+    assert device.idle_last_seen == device.last_seen
+    return nowstamp
+
+
+async def test_idle_device_is_skipped(hass: HomeAssistant, setup_bermuda_entry: MockConfigEntry):
+    """Test that a timed-out, not_home device skips its scanner calculations."""
+    coordinator = setup_bermuda_entry.runtime_data.coordinator
+    device, _scanner = _setup_device(coordinator)
+    nowstamp = _go_idle(device)
+
+    with patch.object(BermudaDeviceScanner, "calculate_data") as scanner_calc:
+        device.calculate_data(nowstamp + 1)
+    scanner_calc.assert_not_called()
+
+
+async def test_idle_device_wakes_on_update_scanner(hass: HomeAssistant, setup_bermuda_entry: MockConfigEntry):
+    """Test that any advert wakes an idle device, even one that doesn't move last_seen on."""
+    coordinator = setup_bermuda_entry.runtime_data.coordinator
+    device, scanner = _setup_device(coordinator)
+    nowstamp = _go_idle(device)
+
+    # Pretend we've since heard a newer advert elsewhere, so this one is older than last_seen.
+    device.last_seen += 50
+    device.idle_last_seen = device.last_seen
+    last_seen = device.last_seen
+    device.update_scanner(scanner, _scandata(-70))
+    assert device.last_seen == last_seen
+    assert device.idle_last_seen is None
+
+    with patch.object(BermudaDeviceScanner, "calculate_data") as scanner_calc:
+        device.calculate_data(nowstamp + 1)
+    scanner_calc.assert_called_once()
+
+
+async def test_idle_device_wakes_on_set_ref_power(hass: HomeAssistant, setup_bermuda_entry: MockConfigEntry):
+    """Test that changing ref_power wakes an idle device."""
+    coordinator = setup_bermuda_entry.runtime_data.coordinator
+    device, _scanner = _setup_device(coordinator)
+    nowstamp = _go_idle(device)
+
+    device.set_ref_power(-50)
+    assert device.idle_last_seen is None
+
+    with patch.object(BermudaDeviceScanner, "calculate_data") as scanner_calc:
+        device.calculate_data(nowstamp + 1)
+    scanner_calc.assert_called_once()
+
+
+async def test_idle_metadevice_wakes_with_source(hass: HomeAssistant, setup_bermuda_entry: MockConfigEntry):
+    """Test that an idle metadevice wakes when its source's last_seen moves on."""
+    coordinator = setup_bermuda_entry.runtime_data.coordinator
+    source, scanner = _setup_device(coordinator)
+    metadevice = coordinator._get_or_create_device("fedcba9876543210fedcba9876543210_1_2")
+    metadevice.beacon_sources = [source.address]
+    coordinator.metadevices[metadevice.address] = metadevice
+
+    coordinator.update_metadevices()
+    assert metadevice.last_seen == source.last_seen
+    nowstamp = _go_idle(metadevice)
+
+    # Nothing new from the source, so the metadevice stays asleep.
+    coordinator.update_metadevices()
+    assert metadevice.idle_last_seen == metadevice.last_seen
+
+    last_seen = metadevice.last_seen
+    # A newer advert on the source moves the metadevice's last_seen, waking it.
+    with patch(
+        "custom_components.bermuda.bermuda_device_scanner.MONOTONIC_TIME",
+        return_value=source.last_seen + 10,
+    ):
+        source.update_scanner(scanner, _scandata(-70))
+    coordinator.update_metadevices()
+    assert metadevice.last_seen == source.last_seen == last_seen + 10
+    assert metadevice.idle_last_seen != metadevice.last_seen
+
+    with patch.object(BermudaDeviceScanner, "calculate_data") as scanner_calc:
+        metadevice.calculate_data(nowstamp + 1)
+    scanner_calc.assert_called_once()
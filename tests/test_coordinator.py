@@ -0,0 +1,128 @@
+"""Test Bermuda BLE Trilateration coordinator."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.components.bluetooth import MONOTONIC_TIME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from custom_components.bermuda.const import REDACT_CACHE_MAX, SAVEOUT_COOLDOWN
+
+
+async def test_redact_data(hass: HomeAssistant, setup_bermuda_entry: MockConfigEntry):
+    """Test that known and unknown addresses are washed from nested data."""
+    coordinator = setup_bermuda_entry.runtime_data.coordinator
+    coordinator.scanner_list.append("AA:BB:CC:DD:EE:FF")
+
+    data = {
+        "AA:BB:CC:DD:EE:FF": ["Seen by aa:bb:cc:dd:ee:ff", "11:22:33:44:55:66", 5],
+        "other": {"nested": ["12:34:56:78:9A:BC"]},
+    }
+    redacted = coordinator.redact_data(data)
+
+    scanner_fix = coordinator.redactions["aa:bb:cc:dd:ee:ff"]
+    assert scanner_fix.startswith("aa::SCANNER_")
+    assert redacted == {
+        scanner_fix: [f"seen by {scanner_fix}", "11:xx:xx:xx:xx:66", 5],
+        "other": {"nested": ["12:xx:xx:xx:xx:bc"]},
+    }
+
+    # Repeat calls give the same answer, cached or not.
+    assert coordinator.redact_data(data) == redacted
+
+
+async def test_redact_cache_eviction(hass: HomeAssistant, setup_bermuda_entry: MockConfigEntry):
+    """Test that overfilling the redaction cache keeps the most-used strings."""
+    coordinator = setup_bermuda_entry.runtime_data.coordinator
+    coordinator.scanner_list.append("AA:BB:CC:DD:EE:FF")
+
+    hot = "Seen by aa:bb:cc:dd:ee:ff"
+    hot_redacted = coordinator.redact_data([hot, hot, hot])[0]
+    scanner_fix = coordinator.redactions["aa:bb:cc:dd:ee:ff"]
+    assert hot_redacted == f"seen by {scanner_fix}"
+
+    # One more string than the cache holds, so it evicts partway through the walk.
+    fillers = [f"dev {n} 12:34:56:78:9a:bc" for n in range(REDACT_CACHE_MAX)]
+    expected = [f"dev {n} 12:xx:xx:xx:xx:bc" for n in range(REDACT_CACHE_MAX)]
+    assert coordinator.redact_data(fillers) == expected
+
+    assert len(coordinator._redact_cache) == REDACT_CACHE_MAX // 2
+    assert coordinator._redact_cache[hot] == hot_redacted
+    # Survivors have their use counts halved.
+    assert coordinator._redact_cache_hits[hot] == 3 // 2 + 1
+
+    # Output is the same whether strings were kept or evicted.
+    assert coordinator.redact_data([hot, *fillers]) == [hot_redacted, *expected]
+
+
+async def test_saveout_cancelled_when_config_matches(hass: HomeAssistant, setup_bermuda_entry: MockConfigEntry):
+    """Test that a parked save-out is dropped once the scanners match the saved entry again."""
+    # Save the running scanners to the entry first. That reloads it, giving us a fresh coordinator.
+    coordinator = setup_bermuda_entry.runtime_data.coordinator
+    coordinator._refresh_scanners()
+    confdata_scanners = coordinator._pending_confdata_scanners
+    assert confdata_scanners is not None
+    coordinator._async_cancel_saveout()
+    coordinator.async_call_update_entry(confdata_scanners)
+    await hass.async_block_till_done()
+    coordinator = setup_bermuda_entry.runtime_data.coordinator
+
+    def park_saveout():
+        # As _refresh_scanners does for a change that has since reverted.
+        coordinator._pending_confdata_scanners = {**confdata_scanners, "aa:bb:cc:dd:ee:ff": {"name": "Gone"}}
+        coordinator._saveout_cancel = async_call_later(hass, SAVEOUT_COOLDOWN, coordinator._async_flush_saveout)
+
+    with patch.object(coordinator, "async_call_update_entry") as update_entry:
+        # Either the entry's data or (once recorded) the snapshot matches.
+        for _ in range(2):
+            park_saveout()
+            assert coordinator._refresh_scanners()
+            assert coordinator._pending_confdata_scanners is None
+            assert coordinator._saveout_cancel is None
+            assert coordinator._confdata_scanners_snapshot is not None
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=SAVEOUT_COOLDOWN + 1))
+        await hass.async_block_till_done()
+    update_entry.assert_not_called()
+
+
+async def test_devreg_update_runs_after_scheduled_update(hass: HomeAssistant, setup_bermuda_entry: MockConfigEntry):
+    """Test that a device registry change gets its own update, even right after a scheduled one."""
+    coordinator = setup_bermuda_entry.runtime_data.coordinator
+    await coordinator._async_update_data()
+
+    with patch.object(coordinator, "update_metadevices", wraps=coordinator.update_metadevices) as update_metadevices:
+        # An unknown device being removed flags a Private BLE Device rescan.
+        hass.bus.async_fire(EVENT_DEVICE_REGISTRY_UPDATED, {"action": "remove", "device_id": "not_a_scanner"})
+        await hass.async_block_till_done()
+
+    update_metadevices.assert_called_once()
+    assert not coordinator._do_private_device_init
+
+
+async def test_count_active_devices_includes_fresh_metadevice(
+    hass: HomeAssistant, setup_bermuda_entry: MockConfigEntry
+):
+    """Test that a metadevice freshened from its source is counted in the same update."""
+    coordinator = setup_bermuda_entry.runtime_data.coordinator
+    source = coordinator._get_or_create_device("11:22:33:44:55:66")
+    source.last_seen = MONOTONIC_TIME()
+    metadevice = coordinator._get_or_create_device("fedcba9876543210fedcba9876543210_1_2")
+    metadevice.beacon_sources = [source.address]
+    metadevice.is_metadevice = True
+    coordinator.metadevices[metadevice.address] = metadevice
+
+    await coordinator._async_update_data()
+
+    assert metadevice.last_seen == source.last_seen
+    fresh_stamp = MONOTONIC_TIME() - 10
+    assert coordinator.count_active_devices() == sum(
+        1 for device in coordinator.devices.values() if device.last_seen > fresh_stamp
+    )
+    assert coordinator.count_active_devices() >= 2